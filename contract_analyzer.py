@@ -1,9 +1,17 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import orjson
 import requests
+from aiolimiter import AsyncLimiter
 import pandas as pd
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dateutil.tz import tzlocal
 
 class ContractAnalyzer:
-    def __init__(self, contract_address, api_key):
+    def __init__(self, contract_address, api_key, cache_ttl=None):
         """
         Initialize the ContractAnalyzer with contract details and API credentials.
 
@@ -14,6 +22,8 @@ class ContractAnalyzer:
         Args:
             contract_address (str): Ethereum contract address (e.g., '0x...').
             api_key (str): Etherscan API key for accessing blockchain data.
+            cache_ttl (float, optional): Seconds before the cached contract-wide token transfers are
+                                         refetched (default: None, cache for the analyzer's lifetime).
         """
         self.contract_address = contract_address.lower()  # Ensure address is lowercase for consistency
         self.api_key = api_key  # Store Etherscan API key
@@ -22,6 +32,20 @@ class ContractAnalyzer:
         self.deployer_address = None  # Store deployer wallet address
         self.creation_timestamp = None  # Store timestamp of contract creation
         self.total_supply = None  # Store total token supply
+        self.max_concurrency = 10  # Maximum number of in-flight async API requests
+        self._semaphore = None  # Per-loop semaphore bounding async API requests
+        self._rate_limiter = None  # Per-loop token bucket pacing async requests to Etherscan's 5 req/s limit
+        self._async_limits_loop = None  # Event loop the semaphore and rate limiter belong to
+        self._eth_tx_cache = {}  # Cache of raw ETH transactions keyed by (wallet, startblock, endblock, page, offset)
+        self._token_tx_cache = {}  # Cache of raw token transfers keyed by wallet
+        self.cache_ttl = cache_ttl  # Lifetime of the contract-wide token transfer cache
+        self._contract_token_txs = None  # Cached raw token transfers for the whole contract
+        self._contract_token_txs_time = None  # Monotonic time the contract-wide transfers were fetched
+        self._etag_cache = {}  # Last (ETag, decoded response) per request, for conditional requests
+        self._session = requests.Session()  # Keep-alive session reused across API requests
+        self._session.headers.update({"User-Agent": "contract-tracker"})  # Identify the client
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])  # Retry transient errors
+        self._session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retries))  # Pooled HTTPS adapter
 
     def _make_api_request(self, params):
         """
@@ -37,12 +61,163 @@ class ContractAnalyzer:
         Returns:
             list: API response data if successful, else an empty list.
         """
+        return self._api_result(self._send_api_request(params))  # Send request and extract result
+
+    def _send_api_request(self, params):
+        """
+        Send an Etherscan API request and return the decoded JSON response.
+
+        Requests go through the analyzer's keep-alive session so the TCP/TLS connection is
+        reused. If an earlier response for the same query carried an ETag, the request is made
+        conditional and a 304 Not Modified reuses the cached body.
+
+        Args:
+            params (dict): Dictionary of API query parameters (e.g., module, action).
+
+        Returns:
+            dict: Decoded API response with status, message and result fields.
+        """
         params["apikey"] = self.api_key  # Add API key to parameters
-        response = requests.get(self.base_url, params=params).json()  # Send GET request
+        key, headers = self._conditional_request(params)  # Cache key and If-None-Match header
+        http_response = self._session.get(self.base_url, params=params, headers=headers)  # Send GET request over pooled connection
+        if http_response.status_code == 304 and key in self._etag_cache:  # Unchanged since last fetch
+            response = self._etag_cache[key][1]  # Reuse cached response
+        else:
+            response = orjson.loads(http_response.content)  # Decode JSON body with orjson
+            self._store_etag(key, http_response.headers.get("ETag"), response)  # Remember ETag for next time
+        return response  # Return decoded response
+
+    async def _send_api_request_async(self, params, session):
+        """
+        Async counterpart of `_send_api_request` sharing one aiohttp session.
+
+        This method sends the API request through the given session, holding the
+        per-run semaphore so that at most `max_concurrency` requests are in flight
+        against Etherscan at any time. Requests are also paced by a token bucket to
+        stay under Etherscan's 5 requests/second limit instead of running into 429s.
+
+        Args:
+            params (dict): Dictionary of API query parameters (e.g., module, action).
+            session (aiohttp.ClientSession): Session used to send the request.
+
+        Returns:
+            dict: Decoded API response with status, message and result fields.
+        """
+        params = {**params, "apikey": self.api_key}  # Add API key without mutating caller's dict
+        self._bind_async_limits()  # Make sure limits exist for the running loop
+        async with self._semaphore, self._rate_limiter:  # Bound concurrency and pace request rate
+            key, headers = self._conditional_request(params)  # Cache key and If-None-Match header
+            async with session.get(self.base_url, params=params, headers=headers) as http_response:  # Send GET request
+                if http_response.status == 304 and key in self._etag_cache:  # Unchanged since last fetch
+                    response = self._etag_cache[key][1]  # Reuse cached response
+                else:
+                    response = orjson.loads(await http_response.read())  # Decode JSON body with orjson
+                    self._store_etag(key, http_response.headers.get("ETag"), response)  # Remember ETag for next time
+        return response  # Return decoded response
+
+    def _api_result(self, response):
+        """
+        Extract the result data from a decoded API response.
+
+        Args:
+            response (dict): Decoded API response.
+
+        Returns:
+            list: API response data if successful, else an empty list.
+        """
         if response["status"] == "1":  # Check if request was successful
             return response["result"]  # Return result data
         return []  # Return empty list on failure
 
+    def _is_cacheable(self, response):
+        """
+        Check whether a response reflects real data that is safe to cache.
+
+        Etherscan reports both "no transactions" and errors such as rate limiting with
+        status "0"; only the former is a genuine empty result.
+
+        Args:
+            response (dict): Decoded API response.
+
+        Returns:
+            bool: True for successful responses and "No transactions found" answers.
+        """
+        if response["status"] == "1":  # Successful response
+            return True
+        return str(response.get("message", "")).startswith("No transactions found")  # Genuine empty result
+
+    def _conditional_request(self, params):
+        """
+        Build the ETag cache key and conditional headers for an API request.
+
+        Args:
+            params (dict): Dictionary of API query parameters, including the API key.
+
+        Returns:
+            tuple: (cache_key, headers) where headers carry If-None-Match when an ETag is known.
+        """
+        key = tuple(sorted((name, str(value)) for name, value in params.items() if name != "apikey"))  # Query identity
+        headers = {}  # Extra request headers
+        if key in self._etag_cache:  # If a previous response carried an ETag
+            headers["If-None-Match"] = self._etag_cache[key][0]  # Ask the server to skip unchanged bodies
+        return key, headers  # Return cache key and headers
+
+    def _store_etag(self, key, etag, response):
+        """
+        Remember a successful response and its ETag for later conditional requests.
+
+        Args:
+            key (tuple): Cache key from `_conditional_request`.
+            etag (str): ETag header of the response, or None if absent.
+            response (dict): Decoded JSON response.
+        """
+        if etag and response.get("status") == "1":  # Only cache successful, tagged responses
+            self._etag_cache[key] = (etag, response)  # Store ETag and response
+
+    def _bind_async_limits(self):
+        """
+        Create the request semaphore and rate limiter for the running event loop.
+
+        Both primitives belong to the loop they are first used on, so they are recreated
+        whenever the analyzer's async methods run on a different loop. This lets the public
+        `*_async` methods be awaited directly with a caller-owned session.
+        """
+        loop = asyncio.get_running_loop()  # Loop the request is running on
+        if self._async_limits_loop is not loop:  # First use on this loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)  # Bound concurrent requests
+            self._rate_limiter = AsyncLimiter(max_rate=5, time_period=1)  # Pace requests to 5 req/s
+            self._async_limits_loop = loop  # Remember the owning loop
+
+    def _run_async(self, coro_fn, *args):
+        """
+        Run an async analyzer coroutine from synchronous code.
+
+        This method opens a shared aiohttp session plus a fresh semaphore and rate limiter
+        for the run, then drives the coroutine to completion with `asyncio.run`.
+
+        `asyncio.run` cannot be called while an event loop is already running in this thread
+        (e.g. inside Jupyter). In that case the coroutine runs on its own loop in a worker
+        thread and this call blocks until it finishes, like the plain synchronous fetchers do.
+        Async callers that don't want to block their loop should await the `*_async` methods.
+
+        Args:
+            coro_fn (callable): Async method taking the session as its last argument.
+            *args: Positional arguments passed to `coro_fn` before the session.
+
+        Returns:
+            Any: The coroutine's result.
+        """
+        async def runner():
+            self._bind_async_limits()  # Semaphore and rate limiter bound to this run's loop
+            async with aiohttp.ClientSession() as session:  # One session for the whole run
+                return await coro_fn(*args, session)  # Run the coroutine
+        try:
+            asyncio.get_running_loop()  # Check for a loop already running in this thread
+        except RuntimeError:  # No running loop
+            return asyncio.run(runner())  # Drive the event loop to completion
+        with ThreadPoolExecutor(max_workers=1) as executor:  # Running loop (e.g. Jupyter): use a worker thread
+            return executor.submit(asyncio.run, runner()).result()  # Run on the worker's own loop and wait
+
     def get_contract_creation_tx(self):
         """
         Retrieve the contract creation transaction and deployer address.
@@ -66,22 +241,114 @@ class ContractAnalyzer:
             return self.creation_tx  # Return creation tx details
         return None  # Return None if no creation tx found
 
-    def get_eth_transactions(self, wallet_address, startblock=0, endblock=99999999):
+    def get_eth_transactions(self, wallet_address, startblock=0, endblock=99999999, page=None, offset=None):
         """
         Fetch ETH transactions for a specified wallet.
 
         This method retrieves all ETH transactions (both incoming and outgoing) for a given wallet
         using the Etherscan API. It converts transaction values from Wei to ETH and ensures timestamps
-        are integers for consistency.
+        are integers for consistency. Results are cached per wallet and block range, so repeated
+        lookups of the same wallet don't hit the API again.
+
+        Args:
+            wallet_address (str): Wallet address to query transactions for.
+            startblock (int): Starting block number for transaction query (default: 0).
+            endblock (int): Ending block number for transaction query (default: 99999999).
+            page (int, optional): Result page to fetch when paginating (default: None, no pagination).
+            offset (int, optional): Number of transactions per page (default: None, no pagination).
+
+        Returns:
+            pd.DataFrame: DataFrame of ETH transactions with columns like hash, from, to, value, timeStamp.
+        """
+        txs = self._get_eth_tx_list(wallet_address, startblock, endblock, page, offset)  # Fetch transactions
+        return self._eth_txs_to_df(txs)  # Return transaction DataFrame
+
+    async def get_eth_transactions_async(self, wallet_address, session, startblock=0, endblock=99999999,
+                                         page=None, offset=None):
+        """
+        Async variant of `get_eth_transactions` using a shared aiohttp session.
 
         Args:
             wallet_address (str): Wallet address to query transactions for.
+            session (aiohttp.ClientSession): Session used to send the request.
             startblock (int): Starting block number for transaction query (default: 0).
             endblock (int): Ending block number for transaction query (default: 99999999).
+            page (int, optional): Result page to fetch when paginating (default: None, no pagination).
+            offset (int, optional): Number of transactions per page (default: None, no pagination).
 
         Returns:
             pd.DataFrame: DataFrame of ETH transactions with columns like hash, from, to, value, timeStamp.
         """
+        txs = await self._get_eth_tx_list_async(wallet_address, session, startblock, endblock, page, offset)  # Fetch transactions
+        return self._eth_txs_to_df(txs)  # Return transaction DataFrame
+
+    def _get_eth_tx_list(self, wallet_address, startblock=0, endblock=99999999, page=None, offset=None):
+        """
+        Fetch raw ETH transactions for a wallet, cached per query.
+
+        Callers that only need counts or a few fields should use this list directly instead
+        of paying for DataFrame construction. The returned list is shared with the cache and
+        must not be mutated. Error responses (e.g. rate limiting) are returned as an empty
+        list but never cached, so the next call retries them.
+
+        Args:
+            wallet_address (str): Wallet address to query transactions for.
+            startblock (int): Starting block number for transaction query (default: 0).
+            endblock (int): Ending block number for transaction query (default: 99999999).
+            page (int, optional): Result page to fetch when paginating (default: None, no pagination).
+            offset (int, optional): Number of transactions per page (default: None, no pagination).
+
+        Returns:
+            list: Raw transaction dicts returned by the API.
+        """
+        key = (wallet_address.lower(), startblock, endblock, page, offset)  # Cache key for this query
+        if key not in self._eth_tx_cache:  # Only hit the API on a cache miss
+            params = self._eth_tx_params(wallet_address, startblock, endblock, page, offset)  # API parameters for ETH transaction query
+            response = self._send_api_request(params)  # Fetch transactions
+            if not self._is_cacheable(response):  # Don't remember errors such as rate limiting
+                return self._api_result(response)  # Return empty result uncached
+            self._eth_tx_cache[key] = self._api_result(response)  # Cache transactions
+        return self._eth_tx_cache[key]  # Return cached transactions
+
+    async def _get_eth_tx_list_async(self, wallet_address, session, startblock=0, endblock=99999999,
+                                     page=None, offset=None):
+        """
+        Async variant of `_get_eth_tx_list` using a shared aiohttp session.
+
+        Args:
+            wallet_address (str): Wallet address to query transactions for.
+            session (aiohttp.ClientSession): Session used to send the request.
+            startblock (int): Starting block number for transaction query (default: 0).
+            endblock (int): Ending block number for transaction query (default: 99999999).
+            page (int, optional): Result page to fetch when paginating (default: None, no pagination).
+            offset (int, optional): Number of transactions per page (default: None, no pagination).
+
+        Returns:
+            list: Raw transaction dicts returned by the API.
+        """
+        key = (wallet_address.lower(), startblock, endblock, page, offset)  # Cache key for this query
+        if key not in self._eth_tx_cache:  # Only hit the API on a cache miss
+            params = self._eth_tx_params(wallet_address, startblock, endblock, page, offset)  # API parameters for ETH transaction query
+            response = await self._send_api_request_async(params, session)  # Fetch transactions
+            if not self._is_cacheable(response):  # Don't remember errors such as rate limiting
+                return self._api_result(response)  # Return empty result uncached
+            self._eth_tx_cache[key] = self._api_result(response)  # Cache transactions
+        return self._eth_tx_cache[key]  # Return cached transactions
+
+    def _eth_tx_params(self, wallet_address, startblock, endblock, page=None, offset=None):
+        """
+        Build Etherscan query parameters for a wallet's ETH transactions.
+
+        Args:
+            wallet_address (str): Wallet address to query transactions for.
+            startblock (int): Starting block number for transaction query.
+            endblock (int): Ending block number for transaction query.
+            page (int, optional): Result page to fetch when paginating.
+            offset (int, optional): Number of transactions per page.
+
+        Returns:
+            dict: API query parameters for the `txlist` action.
+        """
         params = {
             "module": "account",
             "action": "txlist",
@@ -90,11 +357,25 @@ class ContractAnalyzer:
             "endblock": endblock,
             "sort": "asc"
         }  # API parameters for ETH transaction query
-        txs = self._make_api_request(params)  # Fetch transactions
+        if page is not None and offset is not None:  # If pagination is requested
+            params["page"] = page  # Page number
+            params["offset"] = offset  # Transactions per page
+        return params  # Return query parameters
+
+    def _eth_txs_to_df(self, txs):
+        """
+        Convert raw ETH transactions into a DataFrame with ETH values.
+
+        Args:
+            txs (list): Raw transaction dicts returned by the API.
+
+        Returns:
+            pd.DataFrame: DataFrame of ETH transactions with values in ETH and integer timestamps.
+        """
         df = pd.DataFrame(txs)  # Convert to DataFrame
         if not df.empty:  # If transactions exist
-            df["value"] = df["value"].astype(float) / 1e18  # Convert Wei to ETH
-            df["timeStamp"] = df["timeStamp"].astype(int)  # Ensure timestamp is integer
+            df["value"] = pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=float) / 1e18  # Convert Wei to ETH
+            df["timeStamp"] = pd.to_numeric(df["timeStamp"]).astype("int64")  # Ensure timestamp is 64-bit integer
         return df  # Return transaction DataFrame
 
     def get_token_transfers(self, wallet_address=None):
@@ -103,7 +384,8 @@ class ContractAnalyzer:
 
         This method retrieves token transfer events for the specified contract, optionally
         filtered by a wallet address. It adjusts token amounts based on the contract’s decimal
-        places and ensures timestamps are integers.
+        places and ensures timestamps are integers. Per-wallet results are cached so recipients
+        shared between analyses are only fetched once.
 
         Args:
             wallet_address (str, optional): Wallet address to filter transfers (default: None, all transfers).
@@ -111,6 +393,114 @@ class ContractAnalyzer:
         Returns:
             pd.DataFrame: DataFrame of token transfers with columns like hash, to, value, timeStamp.
         """
+        txs = self._get_token_tx_list(wallet_address)  # Fetch token transfers
+        return self._token_txs_to_df(txs)  # Return transfer DataFrame
+
+    async def get_token_transfers_async(self, wallet_address, session):
+        """
+        Async variant of `get_token_transfers` using a shared aiohttp session.
+
+        Args:
+            wallet_address (str): Wallet address to filter transfers (None for all transfers).
+            session (aiohttp.ClientSession): Session used to send the request.
+
+        Returns:
+            pd.DataFrame: DataFrame of token transfers with columns like hash, to, value, timeStamp.
+        """
+        txs = await self._get_token_tx_list_async(wallet_address, session)  # Fetch token transfers
+        return self._token_txs_to_df(txs)  # Return transfer DataFrame
+
+    def _get_token_tx_list(self, wallet_address=None):
+        """
+        Fetch raw token transfers for the contract or a wallet, cached per wallet.
+
+        The contract-wide transfer list is cached too, since several analyses start from it;
+        it is refetched once `cache_ttl` seconds have passed, if set. Error responses are
+        returned as an empty list but never cached. The returned list is shared with the cache
+        and must not be mutated.
+
+        Args:
+            wallet_address (str, optional): Wallet address to filter transfers (default: None, all transfers).
+
+        Returns:
+            list: Raw transfer dicts returned by the API.
+        """
+        key = wallet_address.lower() if wallet_address else None  # Cache key for this query
+        if key is None:  # Contract-wide query
+            if not self._contract_token_txs_fresh():  # Only hit the API if missing or expired
+                response = self._send_api_request(self._token_tx_params())  # Fetch token transfers
+                if not self._is_cacheable(response):  # Don't remember errors such as rate limiting
+                    return self._api_result(response)  # Return empty result uncached
+                self._store_contract_token_txs(self._api_result(response))  # Cache token transfers
+            return self._contract_token_txs  # Return cached transfers
+        if key not in self._token_tx_cache:  # Only hit the API on a cache miss
+            params = self._token_tx_params(wallet_address)  # API parameters for token transfer query
+            response = self._send_api_request(params)  # Fetch token transfers
+            if not self._is_cacheable(response):  # Don't remember errors such as rate limiting
+                return self._api_result(response)  # Return empty result uncached
+            self._token_tx_cache[key] = self._api_result(response)  # Cache token transfers
+        return self._token_tx_cache[key]  # Return cached transfers
+
+    async def _get_token_tx_list_async(self, wallet_address, session):
+        """
+        Async variant of `_get_token_tx_list` using a shared aiohttp session.
+
+        Args:
+            wallet_address (str): Wallet address to filter transfers (None for all transfers).
+            session (aiohttp.ClientSession): Session used to send the request.
+
+        Returns:
+            list: Raw transfer dicts returned by the API.
+        """
+        key = wallet_address.lower() if wallet_address else None  # Cache key for this query
+        if key is None:  # Contract-wide query
+            if not self._contract_token_txs_fresh():  # Only hit the API if missing or expired
+                response = await self._send_api_request_async(self._token_tx_params(), session)  # Fetch token transfers
+                if not self._is_cacheable(response):  # Don't remember errors such as rate limiting
+                    return self._api_result(response)  # Return empty result uncached
+                self._store_contract_token_txs(self._api_result(response))  # Cache token transfers
+            return self._contract_token_txs  # Return cached transfers
+        if key not in self._token_tx_cache:  # Only hit the API on a cache miss
+            params = self._token_tx_params(wallet_address)  # API parameters for token transfer query
+            response = await self._send_api_request_async(params, session)  # Fetch token transfers
+            if not self._is_cacheable(response):  # Don't remember errors such as rate limiting
+                return self._api_result(response)  # Return empty result uncached
+            self._token_tx_cache[key] = self._api_result(response)  # Cache token transfers
+        return self._token_tx_cache[key]  # Return cached transfers
+
+    def _contract_token_txs_fresh(self):
+        """
+        Check whether the cached contract-wide token transfers can be reused.
+
+        Returns:
+            bool: True if transfers are cached and have not outlived `cache_ttl`.
+        """
+        if self._contract_token_txs is None:  # Nothing cached yet
+            return False
+        if self.cache_ttl is None:  # No expiry configured
+            return True
+        return time.monotonic() - self._contract_token_txs_time < self.cache_ttl  # Within TTL
+
+    def _store_contract_token_txs(self, txs):
+        """
+        Cache the contract-wide token transfers along with their fetch time.
+
+        Args:
+            txs (list): Raw transfer dicts returned by the API.
+        """
+        self._contract_token_txs = txs  # Cache token transfers
+        self._contract_token_txs_time = time.monotonic()  # Record fetch time
+
+    def _token_tx_params(self, wallet_address=None):
+        """
+        Build Etherscan query parameters for the contract's token transfers.
+
+        Args:
+            wallet_address (str, optional): Wallet address to filter transfers (default: None, all transfers).
+
+        Returns:
+            dict: API query parameters for the `tokentx` action.
+        """
         params = {
             "module": "account",
             "action": "tokentx",
@@ -121,12 +511,24 @@ class ContractAnalyzer:
         }  # API parameters for token transfer query
         if wallet_address:  # If wallet address is provided
             params["address"] = wallet_address  # Filter by wallet
-        txs = self._make_api_request(params)  # Fetch token transfers
+        return params  # Return query parameters
+
+    def _token_txs_to_df(self, txs):
+        """
+        Convert raw token transfers into a DataFrame with decimal-adjusted amounts.
+
+        Args:
+            txs (list): Raw transfer dicts returned by the API.
+
+        Returns:
+            pd.DataFrame: DataFrame of token transfers with adjusted values and integer timestamps.
+        """
         df = pd.DataFrame(txs)  # Convert to DataFrame
         if not df.empty:  # If transfers exist
             decimals = int(df["tokenDecimal"].iloc[0]) if "tokenDecimal" in df else 18  # Get token decimals
-            df["value"] = df["value"].astype(float) / 10**decimals  # Adjust token amounts
-            df["timeStamp"] = df["timeStamp"].astype(int)  # Ensure timestamp is integer
+            divisor = 10.0 ** decimals  # Scale factor from raw units to tokens
+            df["value"] = pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=float) / divisor  # Adjust token amounts
+            df["timeStamp"] = pd.to_numeric(df["timeStamp"]).astype("int64")  # Ensure timestamp is 64-bit integer
         return df  # Return transfer DataFrame
 
     def get_token_supply(self):
@@ -156,20 +558,88 @@ class ContractAnalyzer:
         Estimate wallet creation time based on its first transaction.
 
         This method fetches the earliest transaction for a wallet to approximate its creation time,
-        returning both the timestamp and block number of the first transaction.
+        returning both the timestamp and block number of the first transaction. Only a single
+        transaction is requested (page 1, one result per page, ascending order) and the raw
+        JSON is read directly instead of building a DataFrame. If the wallet's full history is
+        already cached, its first entry is used without any request; the single-transaction
+        query is cached as well.
+
+        Args:
+            wallet_address (str): Wallet address to check.
+
+        Returns:
+            tuple: (timestamp, block_number) of the first transaction, or (None, None) if no transactions.
+        """
+        full_txs = self._eth_tx_cache.get((wallet_address.lower(), 0, 99999999, None, None))  # Cached full history
+        if full_txs is not None:  # Reuse it instead of querying again
+            return self._first_tx_info(full_txs)  # Return timestamp and block
+        txs = self._get_eth_tx_list(wallet_address, 0, 99999999, page=1, offset=1)  # Fetch only the earliest transaction
+        return self._first_tx_info(txs)  # Return timestamp and block
+
+    async def get_wallet_creation_time_async(self, wallet_address, session):
+        """
+        Async variant of `get_wallet_creation_time` using a shared aiohttp session.
 
         Args:
             wallet_address (str): Wallet address to check.
+            session (aiohttp.ClientSession): Session used to send the request.
+
+        Returns:
+            tuple: (timestamp, block_number) of the first transaction, or (None, None) if no transactions.
+        """
+        full_txs = self._eth_tx_cache.get((wallet_address.lower(), 0, 99999999, None, None))  # Cached full history
+        if full_txs is not None:  # Reuse it instead of querying again
+            return self._first_tx_info(full_txs)  # Return timestamp and block
+        txs = await self._get_eth_tx_list_async(wallet_address, session, 0, 99999999, page=1, offset=1)  # Fetch only the earliest transaction
+        return self._first_tx_info(txs)  # Return timestamp and block
+
+    def _first_tx_info(self, txs):
+        """
+        Extract timestamp and block number from the first raw transaction.
+
+        Args:
+            txs (list): Raw transaction dicts returned by the API, oldest first.
 
         Returns:
             tuple: (timestamp, block_number) of the first transaction, or (None, None) if no transactions.
         """
-        txs = self.get_eth_transactions(wallet_address)  # Fetch wallet transactions
-        if not txs.empty:  # If transactions exist
-            first_tx = txs.iloc[0]  # Get earliest transaction
+        if txs:  # If transactions exist
+            first_tx = txs[0]  # Get earliest transaction
             return int(first_tx["timeStamp"]), int(first_tx["blockNumber"])  # Return timestamp and block
         return None, None  # Return None if no transactions
 
+    def _batch_first_tx(self, wallets):
+        """
+        Look up the first transaction of many wallets in one concurrent batch.
+
+        Etherscan's `txlist` action only accepts a single address, so the batch is sent as
+        concurrent requests over one aiohttp session, bounded by `max_concurrency`.
+
+        Args:
+            wallets (list): Wallet addresses to check.
+
+        Returns:
+            dict: Mapping of wallet address to (timestamp, block_number) of its first transaction,
+                  or (None, None) if the wallet has no transactions.
+        """
+        return self._run_async(self._batch_first_tx_async, list(wallets))  # Run the batch
+
+    async def _batch_first_tx_async(self, wallets, session):
+        """
+        Async implementation of `_batch_first_tx`.
+
+        Args:
+            wallets (list): Wallet addresses to check.
+            session (aiohttp.ClientSession): Session used to send the requests.
+
+        Returns:
+            dict: Mapping of wallet address to (timestamp, block_number) of its first transaction.
+        """
+        results = await asyncio.gather(
+            *(self.get_wallet_creation_time_async(wallet, session) for wallet in wallets)
+        )  # Fetch first transactions concurrently
+        return dict(zip(wallets, results))  # Map each wallet to its first transaction
+
     def analyze_funding_transactions(self):
         """
         Analyze ETH transactions funding the deployer wallet.
@@ -186,16 +656,19 @@ class ContractAnalyzer:
         if not self.deployer_address:  # If still no deployer
             return pd.DataFrame()  # Return empty DataFrame
         
-        eth_txs = self.get_eth_transactions(self.deployer_address)  # Fetch deployer’s transactions
-        funding_txs = eth_txs[eth_txs["to"] == self.deployer_address.lower()]  # Filter incoming ETH
+        eth_txs = self._get_eth_tx_list(self.deployer_address)  # Fetch deployer’s raw transactions
+        deployer = self.deployer_address.lower()  # Normalize deployer address for comparison
+        funding_rows = [tx for tx in eth_txs if tx["to"].lower() == deployer]  # Filter incoming ETH in one pass
+        funding_txs = self._eth_txs_to_df(funding_rows)  # Build DataFrame from incoming transactions only
         if not funding_txs.empty:  # If funding transactions exist
             print("Funding Transactions to Deployer:")  # Print header
             print(funding_txs[["hash", "from", "value", "timeStamp"]])  # Print key details
             if self.creation_tx:  # If creation tx exists
                 # Set creation timestamp if creation tx hash is in funding transactions
-                creation_txs = funding_txs[funding_txs["hash"] == self.creation_tx["txHash"]]
-                if not creation_txs.empty:
-                    self.creation_timestamp = int(creation_txs["timeStamp"].iloc[0])
+                creation_hash = self.creation_tx["txHash"]
+                creation_match = next((tx for tx in funding_rows if tx["hash"] == creation_hash), None)
+                if creation_match:
+                    self.creation_timestamp = int(creation_match["timeStamp"])
         return funding_txs  # Return funding transactions
 
     def analyze_token_distribution(self):
@@ -230,10 +703,11 @@ class ContractAnalyzer:
             return {}  # Return empty dict
         
         recipient_wallets = token_txs["to"].unique()  # Get unique recipient addresses
+        results = self._run_async(self._fetch_recipient_tx_lists_async, recipient_wallets)  # Fetch all wallets concurrently
         wallet_txs = {}  # Store transaction data for each wallet
-        for wallet in recipient_wallets:  # Iterate through recipients
-            eth_txs = self.get_eth_transactions(wallet)  # Fetch ETH transactions
-            token_txs_wallet = self.get_token_transfers(wallet)  # Fetch token transactions
+        for wallet, (eth_tx_list, token_tx_list) in zip(recipient_wallets, results):  # Iterate through recipients
+            eth_txs = self._eth_txs_to_df(eth_tx_list)  # Convert ETH transactions to DataFrame
+            token_txs_wallet = self._token_txs_to_df(token_tx_list)  # Convert token transactions to DataFrame
             wallet_txs[wallet] = {
                 "eth_txs": eth_txs,
                 "token_txs": token_txs_wallet
@@ -243,6 +717,26 @@ class ContractAnalyzer:
             print(f"  Token Transactions: {len(token_txs_wallet)}")  # Print token tx count
         return wallet_txs  # Return transaction data
 
+    async def _fetch_recipient_tx_lists_async(self, wallets, session):
+        """
+        Concurrently fetch raw ETH and token transaction lists for each recipient wallet.
+
+        Args:
+            wallets (list): Recipient wallet addresses.
+            session (aiohttp.ClientSession): Session used to send the requests.
+
+        Returns:
+            list: (eth_txs, token_txs) raw list pairs, in the same order as `wallets`.
+        """
+        tasks = [
+            asyncio.gather(
+                self._get_eth_tx_list_async(wallet, session),
+                self._get_token_tx_list_async(wallet, session)
+            )
+            for wallet in wallets
+        ]  # One task per wallet fetching raw ETH and token transactions
+        return await asyncio.gather(*tasks)  # Wait for all wallets
+
     def find_suspicious_wallets(self, time_window=86400*7):
         """
         Identify wallets created around deployment with round token amounts and low activity.
@@ -270,30 +764,47 @@ class ContractAnalyzer:
         if token_txs.empty:  # If no transfers
             return pd.DataFrame()  # Return empty DataFrame
         
-        suspicious_wallets = []  # List to store suspicious wallet data
-        for wallet in token_txs["to"].unique():  # Iterate through recipient wallets
-            wallet_txs = self.get_eth_transactions(wallet)  # Fetch ETH transactions
-            token_txs_wallet = self.get_token_transfers(wallet)  # Fetch token transactions
-            creation_time, _ = self.get_wallet_creation_time(wallet)  # Get wallet creation time
-            
-            if creation_time and abs(creation_time - self.creation_timestamp) <= time_window:  # Check time window
-                token_amount = token_txs_wallet[token_txs_wallet["to"] == wallet]["value"].sum()  # Total tokens received
-                percentage = (token_amount / self.total_supply) * 100  # Percentage of total supply
-                # Check for round amounts (1M tokens or ~1% of supply)
-                is_round = (token_amount >= 1_000_000 or abs(percentage - 1) < 0.1 or abs(percentage - round(percentage)) < 0.1)
-                # Check for low transaction activity
-                low_activity = len(wallet_txs) < 5 and len(token_txs_wallet) < 3
-                if is_round and low_activity:  # If wallet meets criteria
-                    suspicious_wallets.append({
-                        "wallet": wallet,
-                        "token_amount": token_amount,
-                        "percentage": percentage,
-                        "tx_count": len(wallet_txs),
-                        "creation_time": datetime.fromtimestamp(creation_time).strftime("%Y-%m-%d %H:%M:%S")
-                    })  # Add to suspicious wallets
-        
-        df = pd.DataFrame(suspicious_wallets)  # Convert to DataFrame
-        if not df.empty:  # If suspicious wallets found
-            print("Suspicious Wallets (Round Amounts, Low Activity):")  # Print header
-            print(df)  # Print suspicious wallets
+        recipient_wallets = token_txs["to"].unique()  # Get unique recipient addresses
+        token_totals = token_txs.groupby("to", sort=False)["value"].sum().to_dict()  # Total tokens received per wallet
+        first_txs = self._batch_first_tx(recipient_wallets)  # Prefetch first transactions for all recipients
+        candidates = []  # Wallets passing the cheap checks: (wallet, token_amount, percentage, creation_time)
+        for wallet in recipient_wallets:  # Iterate through recipient wallets
+            creation_time, _ = first_txs[wallet]  # Wallet creation time from its first transaction
+            if not creation_time or abs(creation_time - self.creation_timestamp) > time_window:  # Check time window
+                continue  # Skip wallets created outside the window
+            token_amount = token_totals[wallet]  # Total tokens received
+            percentage = (token_amount / self.total_supply) * 100  # Percentage of total supply
+            # Check for round amounts (1M tokens or ~1% of supply)
+            is_round = (token_amount >= 1_000_000 or abs(percentage - 1) < 0.1 or abs(percentage - round(percentage)) < 0.1)
+            if is_round:  # Only round-amount wallets need their activity fetched
+                candidates.append((wallet, token_amount, percentage, creation_time))  # Keep as candidate
+
+        candidate_wallets = [candidate[0] for candidate in candidates]  # Candidate wallet addresses
+        results = self._run_async(self._fetch_recipient_tx_lists_async, candidate_wallets)  # Fetch candidates concurrently
+        suspicious_wallets = []  # Rows of (wallet, token_amount, percentage, tx_count, creation_time)
+        for (wallet, token_amount, percentage, creation_time), (wallet_txs, token_txs_wallet) in zip(candidates, results):
+            # Check for low transaction activity
+            low_activity = len(wallet_txs) < 5 and len(token_txs_wallet) < 3
+            if low_activity:  # If wallet meets criteria
+                suspicious_wallets.append((wallet, token_amount, percentage, len(wallet_txs), creation_time))  # Add to suspicious wallets
+
+        if not suspicious_wallets:  # If no suspicious wallets found
+            return pd.DataFrame()  # Return empty DataFrame
+        df = pd.DataFrame.from_records(
+            suspicious_wallets,
+            columns=["wallet", "token_amount", "percentage", "tx_count", "creation_time"]
+        ).astype({
+            "token_amount": "float64",
+            "percentage": "float64",
+            "tx_count": "int64",
+            "creation_time": "int64"
+        })  # Convert rows to DataFrame in one columnar pass with explicit numeric dtypes
+        # Format creation times as local time strings in a single vectorized pass
+        df["creation_time"] = (
+            pd.to_datetime(df["creation_time"], unit="s", utc=True)
+            .dt.tz_convert(tzlocal())
+            .dt.strftime("%Y-%m-%d %H:%M:%S")
+        )
+        print("Suspicious Wallets (Round Amounts, Low Activity):")  # Print header
+        print(df)  # Print suspicious wallets
         return df  # Return suspicious wallets DataFrame
\ No newline at end of file